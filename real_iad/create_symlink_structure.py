@@ -1,5 +1,5 @@
 """
-基于 JSON 元信息创建符号链接目录结构,适配 AnomalyDINO 项目
+基于 JSON 元信息创建链接目录结构(符号链接或硬链接),适配 AnomalyDINO 项目
 
 使用示例:
     python create_symlink_structure.py \
@@ -8,93 +8,179 @@
         --output_dir data/symlink_dataset
 """
 
-import json
+import errno
+import multiprocessing
 import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List
-from dataclasses import dataclass
+from typing import BinaryIO, DefaultDict, Dict, Iterable, Iterator, List, Set, Tuple
+from dataclasses import dataclass, field
 import argparse
 
+try:
+    # orjson 为可选依赖, 解析速度明显快于标准库 json
+    import orjson
+except ImportError:
+    import json as orjson
 
-@dataclass
-class MetaSample:
-    image_path: str
-    mask_path: str | None
-    label: bool  # True 为异常, False 为正常
-    anomaly_class: str  # 异常类型名称
+try:
+    # ijson 为可选依赖, 安装后以流式方式解析大体积的元信息文件
+    import ijson
+except ImportError:
+    ijson = None
 
+# symlinkat / linkat 仅在部分平台可用; Linux 上以 O_PATH 打开目录, 无需读权限
+_SYMLINK_DIR_FD = os.symlink in os.supports_dir_fd
+_LINK_DIR_FD = os.link in os.supports_dir_fd
+_DIR_OPEN_FLAGS = getattr(os, "O_PATH", os.O_RDONLY) | getattr(os, "O_DIRECTORY", 0)
 
-def load_category_data(json_dir: Path, image_dir: Path) -> Dict[str, Dict[str, List[MetaSample]]]:
+# 每个线程池任务批量创建的链接数, 摊薄逐个提交任务的调度开销
+_LINK_BATCH_SIZE = 256
+
+LINK_MODES = ("symlink", "hardlink", "auto")
+
+
+@dataclass(slots=True)
+class SampleArrays:
+    """以结构数组 (SoA) 形式存放一个划分的样本, 各列表按下标一一对应"""
+    image_paths: List[str] = field(default_factory=list)
+    image_names: List[str] = field(default_factory=list)  # 图像文件名, 加载时预先拆分
+    mask_paths: List[str | None] = field(default_factory=list)
+    labels: List[bool] = field(default_factory=list)  # True 为异常, False 为正常
+    anomaly_classes: List[str] = field(default_factory=list)  # 异常类型名称
+    
+    def __len__(self) -> int:
+        return len(self.image_paths)
+
+
+def _join_prefix(prefix_str: str, rel_path: str) -> str:
+    """将元信息中的路径拼接到前缀后; 与 Path 拼接一致, 绝对路径原样返回"""
+    return rel_path if os.path.isabs(rel_path) else prefix_str + rel_path
+
+
+def _stream_items(f: BinaryIO, split: str) -> Iterator[dict]:
+    """从文件开头流式读取 split 列表中的样本, 列表不存在时不产生任何结果"""
+    f.seek(0)
+    yield from ijson.items(f, f"{split}.item")
+
+
+def _read_splits(f: BinaryIO) -> Iterator[Tuple[str, Iterable]]:
     """
-    从 JSON 文件加载所有类别的数据
+    读取 JSON 文件, 先产生 ("meta", 元信息), 再依次产生 ("train" / "test", 样本序列)
     
-    返回格式:
-    {
-        "category1": {
-            "train": [MetaSample, ...],
-            "test": [MetaSample, ...]
-        },
-        "category2": {...}
-    }
+    安装 ijson 时样本序列为逐条解析的生成器, 任一时刻只有一个样本驻留内存;
+    meta 单独读取后回到文件开头, 因此不依赖顶层键的顺序。各划分需按顺序依次消费。
     """
-    category_datas: Dict[str, Dict[str, List[MetaSample]]] = {}
+    if ijson is None:
+        data = orjson.loads(f.read())
+        yield "meta", data["meta"]
+        for split in ("train", "test"):
+            if split in data:
+                yield split, data[split]
+        return
     
-    for json_file in json_dir.glob("*.json"):
-        print(f"Loading dataset from {json_file}...")
-        with open(json_file, "r") as f:
-            data = json.load(f)
+    meta = next(ijson.items(f, "meta"), None)
+    if meta is None:
+        # 与 orjson 分支中 data["meta"] 的报错保持一致
+        raise KeyError("meta")
+    yield "meta", meta
+    for split in ("train", "test"):
+        yield split, _stream_items(f, split)
+
+
+def _load_one_json(json_file: Path, image_dir: Path) -> Tuple[str, Dict[str, SampleArrays]]:
+    """解析单个 JSON 文件, 返回 (类别名, {"train": [...], "test": [...]})"""
+    with open(json_file, "rb") as f:
+        splits = _read_splits(f)
+        _, meta = next(splits)
         
-        normal_class = data["meta"]["normal_class"]
-        prefix: str = data["meta"]["prefix"]
+        normal_class = meta["normal_class"]
+        prefix: str = meta["prefix"]
         category: str = json_file.stem
         
-        train_samples: List[MetaSample] = []
-        test_samples: List[MetaSample] = []
+        # 同一文件内前缀不变, 只拼接一次 Path, 之后逐样本使用字符串拼接
+        prefix_str = os.fspath(image_dir / prefix) + os.sep
         
-        # 处理训练集
-        if "train" in data:
-            for item in data["train"]:
-                anomaly_class = item.get("anomaly_class", normal_class)
-                is_anomaly = anomaly_class != normal_class
-                image_path = image_dir / prefix / item["image_path"]
-                
-                # 训练集通常只包含正常样本
-                if not is_anomaly:
-                    train_samples.append(
-                        MetaSample(
-                            image_path=str(image_path),
-                            mask_path=None,
-                            label=False,
-                            anomaly_class=normal_class,
-                        )
-                    )
+        train_samples = SampleArrays()
+        test_samples = SampleArrays()
         
-        # 处理测试集
-        if "test" in data:
-            for item in data["test"]:
-                anomaly_class = item["anomaly_class"]
-                is_anomaly = anomaly_class != normal_class
-                image_path = image_dir / prefix / item["image_path"]
-                mask_path = (
-                    image_dir / prefix / item["mask_path"] if is_anomaly and "mask_path" in item
-                    else None
-                )
-                
-                test_samples.append(
-                    MetaSample(
-                        image_path=str(image_path),
-                        mask_path=str(mask_path) if mask_path is not None else None,
-                        label=is_anomaly,
-                        anomaly_class=anomaly_class,
+        for split, items in splits:
+            if split == "train":
+                # 处理训练集
+                for item in items:
+                    anomaly_class = item.get("anomaly_class", normal_class)
+                    is_anomaly = anomaly_class != normal_class
+                    
+                    # 训练集通常只包含正常样本
+                    if not is_anomaly:
+                        rel_path = item["image_path"]
+                        train_samples.image_paths.append(_join_prefix(prefix_str, rel_path))
+                        train_samples.image_names.append(os.path.basename(rel_path))
+                        train_samples.mask_paths.append(None)
+                        train_samples.labels.append(False)
+                        train_samples.anomaly_classes.append(normal_class)
+            else:
+                # 处理测试集
+                for item in items:
+                    anomaly_class = item["anomaly_class"]
+                    is_anomaly = anomaly_class != normal_class
+                    rel_path = item["image_path"]
+                    mask_path = (
+                        _join_prefix(prefix_str, item["mask_path"]) if is_anomaly and "mask_path" in item
+                        else None
                     )
-                )
-        
-        category_datas[category] = {
-            "train": train_samples,
-            "test": test_samples
-        }
+                    
+                    test_samples.image_paths.append(_join_prefix(prefix_str, rel_path))
+                    test_samples.image_names.append(os.path.basename(rel_path))
+                    test_samples.mask_paths.append(mask_path)
+                    test_samples.labels.append(is_anomaly)
+                    test_samples.anomaly_classes.append(anomaly_class)
+    
+    return category, {
+        "train": train_samples,
+        "test": test_samples
+    }
+
+
+def load_category_data(
+    json_dir: Path,
+    image_dir: Path,
+    workers: int | None = None
+) -> Dict[str, Dict[str, SampleArrays]]:
+    """
+    从 JSON 文件加载所有类别的数据, 各文件相互独立, 使用线程池并行解析
+    
+    Args:
+        json_dir: 包含 JSON 元信息文件的目录
+        image_dir: 原始图像根目录, 样本路径会基于其绝对路径生成
+        workers: 线程池大小, None 时使用 CPU 核数
+    
+    返回格式:
+    {
+        "category1": {
+            "train": SampleArrays,
+            "test": SampleArrays
+        },
+        "category2": {...}
+    }
+    """
+    category_datas: Dict[str, Dict[str, SampleArrays]] = {}
+    json_files = list(json_dir.glob("*.json"))
+    
+    # 只解析一次当前工作目录, 之后得到的样本路径均为绝对路径
+    image_dir = image_dir.absolute()
+    
+    print(f"Loading {len(json_files)} files from {json_dir}...")
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as ex:
+        results = ex.map(_load_one_json, json_files, repeat(image_dir))
         
-        print(f"  - Category '{category}': {len(train_samples)} train, {len(test_samples)} test samples")
+        # 在主线程中按文件顺序合并结果, 保证输出有序
+        for category, phases in results:
+            category_datas[category] = phases
+            print(f"  - Category '{category}': {len(phases['train'])} train, {len(phases['test'])} test samples")
     
     return category_datas
 
@@ -107,20 +193,234 @@ def get_anomaly_type(item: dict, normal_class: str) -> str:
     return anomaly_class
 
 
+def _batch_link(task: Tuple[List[str], List[str], int | None, bool]) -> Tuple[int, List[str], int]:
+    """
+    在同一目录下批量创建符号链接或硬链接, 链接已存在时跳过
+    
+    无法创建硬链接时 (无权限, 如 fs.protected_hardlinks 下链接他人的文件; 跨文件系统;
+    链接数达到上限) 改为创建符号链接。改用符号链接后仍检查源文件是否存在,
+    与硬链接一样报告缺失的源文件且不创建悬空链接。
+    
+    Returns:
+        (新建的链接数, 源文件不存在的路径列表, 改用符号链接的数量; 后两者仅硬链接会出现)
+    """
+    srcs, link_paths, dir_fd, requested_hardlink = task
+    hardlink = requested_hardlink
+    symlink = os.symlink
+    link = os.link
+    created = 0
+    fallbacks = 0
+    missing: List[str] = []
+    for src, link_path in zip(srcs, link_paths):
+        try:
+            if hardlink:
+                try:
+                    link(src, link_path, dst_dir_fd=dir_fd)
+                except OSError as e:
+                    if not isinstance(e, PermissionError) and e.errno not in (errno.EXDEV, errno.EMLINK):
+                        raise
+                    # 权限或跨文件系统问题通常对整批文件都成立, 本批其余链接直接使用符号链接
+                    if e.errno != errno.EMLINK:
+                        hardlink = False
+                    symlink(src, link_path, dir_fd=dir_fd)
+                    fallbacks += 1
+            elif requested_hardlink:
+                # 已退回符号链接, 保持硬链接模式的缺失检查
+                if not os.path.exists(src):
+                    missing.append(src)
+                    continue
+                symlink(src, link_path, dir_fd=dir_fd)
+                fallbacks += 1
+            else:
+                symlink(src, link_path, dir_fd=dir_fd)
+        except FileExistsError:
+            continue
+        except FileNotFoundError:
+            # 硬链接要求源文件存在
+            missing.append(src)
+            continue
+        created += 1
+    return created, missing, fallbacks
+
+
+def _dispatch_links(
+    ex: ThreadPoolExecutor,
+    tasks: List[Tuple[str, str, str]],
+    existing: Dict[str, Set[str]],
+    dir_fds: Dict[str, int],
+    use_dir_fd: bool,
+    hardlink: bool
+) -> List[Tuple[int, List[str], int]]:
+    """将 (源文件, 链接目录, 链接名) 任务按目录分批提交到线程池, 返回各批次 _batch_link 的结果"""
+    # 跳过已存在的链接, 无需逐个探测; 其余按目录归集
+    pending: Dict[str, Tuple[List[str], List[str]]] = defaultdict(lambda: ([], []))
+    for src, link_dir, name in tasks:
+        names = existing[link_dir]
+        if name not in names:
+            names.add(name)
+            srcs, link_paths = pending[link_dir]
+            srcs.append(src)
+            link_paths.append(name if use_dir_fd else os.path.join(link_dir, name))
+    
+    # 按目录切分为批次, 每个任务在一个紧凑循环中创建多个链接
+    batches = [
+        (srcs[k:k + _LINK_BATCH_SIZE], link_paths[k:k + _LINK_BATCH_SIZE], dir_fds.get(d), hardlink)
+        for d, (srcs, link_paths) in pending.items()
+        for k in range(0, len(srcs), _LINK_BATCH_SIZE)
+    ]
+    return list(ex.map(_batch_link, batches))
+
+
+def _process_category(
+    category: str,
+    phases: Dict[str, SampleArrays],
+    output_dir: Path,
+    workers: int | None = None,
+    verify: bool = False,
+    link_mode: str = "symlink"
+) -> Tuple[int, int]:
+    """
+    为单个类别创建链接目录结构, link_mode 为 "symlink" 或 "hardlink"
+    
+    Returns:
+        (新建的链接数, 缺失的文件数, 因无法创建硬链接而改用符号链接的数量)
+    """
+    print(f"\nProcessing category: {category}")
+    # 缺失文件的警告在类别处理结束后统一输出, 避免逐条打印
+    missing_msgs: List[str] = []
+    
+    # 先收集 (源文件, 链接目录, 链接名) 任务及所需目录, 统一创建目录后再由线程池并行创建链接
+    # 掩码任务额外记录对应图像, 图像链接失败时跳过其掩码
+    # 循环内统一使用字符串路径, 避免反复构造 Path 对象
+    category_dir = os.path.join(output_dir, category)
+    tasks: List[Tuple[str, str, str]] = []
+    mask_tasks: List[Tuple[str, str, str, str]] = []
+    needed_dirs: Set[str] = set()
+    
+    # 处理训练集
+    train_samples = phases["train"]
+    train_dir = os.path.join(category_dir, "train", "good")
+    needed_dirs.add(train_dir)
+    
+    for image_path, name in zip(train_samples.image_paths, train_samples.image_names):
+        # 链接前默认不检查源文件, 仅在 verify 时检查
+        if verify and not os.path.exists(image_path):
+            missing_msgs.append(f"Image not found: {image_path}")
+            continue
+        
+        tasks.append((image_path, train_dir, name))
+    
+    print(f"  - Created {len(train_samples)} train links")
+    
+    # 处理测试集
+    test_samples = phases["test"]
+    
+    # 按类别分组, 只记录样本下标
+    grouped_samples: DefaultDict[str, List[int]] = defaultdict(list)
+    for i, (label, anomaly_class) in enumerate(zip(test_samples.labels, test_samples.anomaly_classes)):
+        # 正常样本统一归为 'good'
+        grouped_samples[anomaly_class if label else "good"].append(i)
+    
+    # 创建测试集链接
+    for anomaly_type, indices in grouped_samples.items():
+        test_dir = os.path.join(category_dir, "test", anomaly_type)
+        mask_dir = os.path.join(category_dir, "ground_truth", anomaly_type)
+        needed_dirs.add(test_dir)
+        
+        for i in indices:
+            image_path = test_samples.image_paths[i]
+            name = test_samples.image_names[i]
+            mask_path = test_samples.mask_paths[i]
+            # 链接前默认不检查源文件, 仅在 verify 时检查
+            if verify and not os.path.exists(image_path):
+                missing_msgs.append(f"Image not found: {image_path}")
+                continue
+            
+            tasks.append((image_path, test_dir, name))
+            
+            # 只为异常样本创建掩码
+            if test_samples.labels[i] and mask_path:
+                if verify and not os.path.exists(mask_path):
+                    missing_msgs.append(f"Mask not found: {mask_path}")
+                else:
+                    needed_dirs.add(mask_dir)
+                    mask_tasks.append((mask_path, mask_dir, name, image_path))
+        
+        print(f"  - Created {len(indices)} test links for '{anomaly_type}'")
+    
+    if missing_msgs:
+        sys.stderr.write("".join(f"  Warning: {msg}\n" for msg in missing_msgs))
+    
+    # 每个目录只创建一次, 避免逐样本重复 mkdir; 同时一次性读取目录中已有的条目
+    existing: Dict[str, Set[str]] = {}
+    for d in needed_dirs:
+        os.makedirs(d, exist_ok=True)
+        with os.scandir(d) as it:
+            existing[d] = {e.name for e in it}
+    
+    hardlink = link_mode == "hardlink"
+    # 硬链接失败时会退回符号链接, 此时两者都需支持 dir_fd
+    use_dir_fd = (_LINK_DIR_FD and _SYMLINK_DIR_FD) if hardlink else _SYMLINK_DIR_FD
+    
+    # 支持时为每个目录打开一次目录描述符, 通过 symlinkat / linkat 创建链接, 避免每次重新解析父目录
+    dir_fds: Dict[str, int] = {}
+    try:
+        if use_dir_fd:
+            for d in existing:
+                dir_fds[d] = os.open(d, _DIR_OPEN_FLAGS)
+        
+        # os.symlink / os.link 执行系统调用时会释放 GIL, 各批次可在线程池中并行
+        max_workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            results = _dispatch_links(ex, tasks, existing, dir_fds, use_dir_fd, hardlink)
+            
+            # 硬链接要求源文件存在; 与 verify 时一致, 图像缺失的样本不再链接其掩码
+            image_missing = [src for r in results for src in r[1]]
+            skipped = set(image_missing)
+            mask_tasks = [(m, d, n) for m, d, n, image_path in mask_tasks if image_path not in skipped]
+            mask_results = _dispatch_links(ex, mask_tasks, existing, dir_fds, use_dir_fd, hardlink)
+    finally:
+        for fd in dir_fds.values():
+            os.close(fd)
+    
+    mask_missing = [src for r in mask_results for src in r[1]]
+    link_missing = [f"Image not found: {src}" for src in image_missing]
+    link_missing += [f"Mask not found: {src}" for src in mask_missing]
+    if link_missing:
+        sys.stderr.write("".join(f"  Warning: {msg}\n" for msg in link_missing))
+    
+    results += mask_results
+    n_links = sum(r[0] for r in results)
+    n_fallbacks = sum(r[2] for r in results)
+    if n_fallbacks:
+        sys.stderr.write(f"  Note: {n_fallbacks} links created as symlinks because hardlinking was not possible\n")
+    
+    return n_links, len(missing_msgs) + len(link_missing), n_fallbacks
+
+
 def create_symlink_structure(
     json_dir: str | Path,
     image_dir: str | Path,
     output_dir: str | Path,
-    overwrite: bool = False
+    overwrite: bool = False,
+    workers: int | None = None,
+    verify: bool = False,
+    processes: int = 1,
+    link_mode: str = "auto"
 ):
     """
-    基于 JSON 元信息创建符号链接目录结构
+    基于 JSON 元信息创建链接目录结构
     
     Args:
         json_dir: 包含 JSON 元信息文件的目录
         image_dir: 原始图像根目录
-        output_dir: 输出符号链接目录结构的目录
+        output_dir: 输出链接目录结构的目录
         overwrite: 如果输出目录已存在是否覆盖
+        workers: 并行加载 JSON 及创建链接的线程数, None 时使用默认值
+        verify: 是否在创建链接前检查源图像及掩码是否存在
+        processes: 并行处理类别的进程数, 机械硬盘上建议保持为 1
+        link_mode: "symlink" 创建符号链接, "hardlink" 创建硬链接,
+            "auto" 在图像目录与输出目录位于同一文件系统时使用硬链接, 否则使用符号链接
     """
     json_dir = Path(json_dir)
     image_dir = Path(image_dir)
@@ -130,6 +430,8 @@ def create_symlink_structure(
         raise FileNotFoundError(f"JSON directory not found: {json_dir}")
     if not image_dir.exists():
         raise FileNotFoundError(f"Image directory not found: {image_dir}")
+    if link_mode not in LINK_MODES:
+        raise ValueError(f"Unknown link mode: {link_mode}")
     
     if output_dir.exists() and not overwrite:
         print(f"Warning: Output directory {output_dir} already exists.")
@@ -140,90 +442,38 @@ def create_symlink_structure(
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
+    # 硬链接不能跨文件系统
+    if link_mode == "auto":
+        same_fs = os.stat(image_dir).st_dev == os.stat(output_dir).st_dev
+        link_mode = "hardlink" if same_fs else "symlink"
+    
     # 加载所有类别数据
-    category_datas = load_category_data(json_dir, image_dir)
+    category_datas = load_category_data(json_dir, image_dir, workers)
     
-    # 统计信息
-    total_symlinks = 0
-    missing_files = 0
+    # 各类别相互独立, 可分配到多个进程并行处理
+    jobs = [
+        (category, phases, output_dir, workers, verify, link_mode)
+        for category, phases in category_datas.items()
+    ]
+    if processes > 1:
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.starmap(_process_category, jobs)
+    else:
+        results = [_process_category(*job) for job in jobs]
     
-    # 为每个类别创建符号链接结构
-    for category, phases in category_datas.items():
-        print(f"\nProcessing category: {category}")
-        
-        # 处理训练集
-        train_samples = phases["train"]
-        train_dir = output_dir / category / "train" / "good"
-        train_dir.mkdir(parents=True, exist_ok=True)
-        
-        for sample in train_samples:
-            img_path = Path(sample.image_path)
-            if not img_path.exists():
-                print(f"  Warning: Image not found: {img_path}")
-                missing_files += 1
-                continue
-            
-            link_path = train_dir / img_path.name
-            if not link_path.exists():
-                os.symlink(img_path.absolute(), link_path)
-                total_symlinks += 1
-        
-        print(f"  - Created {len(train_samples)} train symlinks")
-        
-        # 处理测试集
-        test_samples = phases["test"]
-        
-        # 按类别分组
-        grouped_samples: Dict[str, List[MetaSample]] = {}
-        for sample in test_samples:
-            # 正常样本统一归为 'good'
-            if not sample.label:
-                anomaly_type = "good"
-            else:
-                anomaly_type = sample.anomaly_class
-            
-            if anomaly_type not in grouped_samples:
-                grouped_samples[anomaly_type] = []
-            grouped_samples[anomaly_type].append(sample)
-        
-        # 创建测试集符号链接
-        for anomaly_type, samples in grouped_samples.items():
-            test_dir = output_dir / category / "test" / anomaly_type
-            test_dir.mkdir(parents=True, exist_ok=True)
-            
-            for sample in samples:
-                img_path = Path(sample.image_path)
-                if not img_path.exists():
-                    print(f"  Warning: Image not found: {img_path}")
-                    missing_files += 1
-                    continue
-                
-                link_path = test_dir / img_path.name
-                if not link_path.exists():
-                    os.symlink(img_path.absolute(), link_path)
-                    total_symlinks += 1
-                
-                # 只为异常样本创建掩码
-                if sample.label and sample.mask_path:
-                    mask_src = Path(sample.mask_path)
-                    if mask_src.exists():
-                        mask_dir = output_dir / category / "ground_truth" / anomaly_type
-                        mask_dir.mkdir(parents=True, exist_ok=True)
-                        
-                        mask_link = mask_dir / img_path.name
-                        if not mask_link.exists():
-                            os.symlink(mask_src.absolute(), mask_link)
-                            total_symlinks += 1
-                    else:
-                        print(f"  Warning: Mask not found: {mask_src}")
-                        missing_files += 1
-            
-            print(f"  - Created {len(samples)} test symlinks for '{anomaly_type}'")
+    # 统计信息
+    total_links = sum(r[0] for r in results)
+    missing_files = sum(r[1] for r in results)
+    total_fallbacks = sum(r[2] for r in results)
     
     print(f"\n{'='*60}")
     print(f"Summary:")
     print(f"  - Categories processed: {len(category_datas)}")
-    print(f"  - Total symlinks created: {total_symlinks}")
+    if total_fallbacks:
+        print(f"  - Link mode: {link_mode} ({total_fallbacks} links fell back to symlinks)")
+    else:
+        print(f"  - Link mode: {link_mode}")
+    print(f"  - Total links created: {total_links}")
     print(f"  - Missing files: {missing_files}")
     print(f"  - Output directory: {output_dir.absolute()}")
     print(f"{'='*60}\n")
@@ -231,7 +481,7 @@ def create_symlink_structure(
 
 def parse_args():
     parser = argparse.ArgumentParser(
-        description="Create symlink structure for AnomalyDINO from JSON metadata"
+        description="Create symlink/hardlink structure for AnomalyDINO from JSON metadata"
     )
     parser.add_argument(
         "--json_dir",
@@ -249,13 +499,38 @@ def parse_args():
         "--output_dir",
         type=str,
         required=True,
-        help="Output directory for symlink structure"
+        help="Output directory for link structure"
     )
     parser.add_argument(
         "--overwrite",
         action="store_true",
         help="Overwrite existing output directory without confirmation"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker threads for loading JSON files and creating links"
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Check that source images and masks exist before linking and report missing files"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Number of processes for handling categories in parallel (keep 1 on rotating disks)"
+    )
+    parser.add_argument(
+        "--link-mode",
+        type=str,
+        choices=LINK_MODES,
+        default="auto",
+        help="Link type to create; 'auto' uses hardlinks when image_dir and output_dir "
+             "are on the same filesystem, symlinks otherwise"
+    )
     return parser.parse_args()
 
 
@@ -266,8 +541,12 @@ if __name__ == "__main__":
         json_dir=args.json_dir,
         image_dir=args.image_dir,
         output_dir=args.output_dir,
-        overwrite=args.overwrite
+        overwrite=args.overwrite,
+        workers=args.workers,
+        verify=args.verify,
+        processes=args.processes,
+        link_mode=args.link_mode
     )
     
-    print("Done! You can now use the symlink structure with AnomalyDINO:")
+    print("Done! You can now use the link structure with AnomalyDINO:")
     print(f"  python run_anomalydino.py --data_root {args.output_dir} --dataset YourDataset")
@@ -6,11 +6,20 @@
 """
 
 import argparse
+import io
 import os
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 
+def _count(path: str) -> int:
+    """统计目录下的条目数量, 目录不存在时返回 0"""
+    try:
+        return len(os.listdir(path))
+    except FileNotFoundError:
+        return 0
+
+
 def scan_dataset_structure(data_root: Path) -> Tuple[List[str], Dict[str, List[str]]]:
     """
     扫描数据集目录结构,自动提取对象类别和异常类型
@@ -25,69 +34,84 @@ def scan_dataset_structure(data_root: Path) -> Tuple[List[str], Dict[str, List[s
     if not data_root.exists():
         raise FileNotFoundError(f"Data root not found: {data_root}")
     
-    # 遍历所有对象类别
-    for obj_dir in sorted(data_root.iterdir()):
-        if not obj_dir.is_dir():
-            continue
-        
-        object_name = obj_dir.name
+    # 遍历所有对象类别, scandir 返回的条目自带文件类型, 无需逐个 stat
+    with os.scandir(data_root) as it:
+        obj_entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    
+    for obj_entry in obj_entries:
+        object_name = obj_entry.name
         objects.append(object_name)
         
         # 查找测试集中的异常类型
-        test_dir = obj_dir / "test"
+        test_dir = os.path.join(obj_entry.path, "test")
         anomaly_types = []
         
-        if test_dir.exists():
-            for anomaly_dir in sorted(test_dir.iterdir()):
-                if anomaly_dir.is_dir() and anomaly_dir.name != "good":
-                    anomaly_types.append(anomaly_dir.name)
+        try:
+            with os.scandir(test_dir) as it:
+                anomaly_types = sorted(e.name for e in it if e.is_dir() and e.name != "good")
+        except FileNotFoundError:
+            pass
         
         object_anomalies[object_name] = anomaly_types
         
         # 统计样本数量
-        train_count = len(list((obj_dir / "train" / "good").glob("*"))) if (obj_dir / "train" / "good").exists() else 0
-        test_count = len(list(test_dir.rglob("*"))) if test_dir.exists() else 0
+        train_count = _count(os.path.join(obj_entry.path, "train", "good"))
+        # os.walk 直接返回字符串, 目录不存在时不产生任何结果
+        test_count = sum(len(files) for _, _, files in os.walk(test_dir))
         
         print(f"  - {object_name}: {train_count} train, {test_count} test samples, {len(anomaly_types)} anomaly types")
     
     return objects, object_anomalies
 
 
+def _quote_join(names: List[str]) -> str:
+    """将名称列表拼接为逗号分隔的双引号字符串"""
+    return ', '.join(f'"{name}"' for name in names)
+
+
 def generate_config_code(dataset_name: str, objects: List[str], object_anomalies: Dict[str, List[str]]) -> str:
     """生成数据集配置代码"""
     
+    # 直接写入同一个缓冲区, 避免拼接出多个中间字符串
+    buf = io.StringIO()
+    w = buf.write
+    
     # 生成对象列表
-    objects_str = ', '.join([f'"{obj}"' for obj in objects])
+    w(f'''
+    elif dataset == "{dataset_name}":
+        objects = [''')
+    w(_quote_join(objects))
+    w(''']
+        
+        object_anomalies = {
+''')
     
     # 生成异常字典
-    anomalies_lines = []
+    sep = ''
     for obj, anomalies in object_anomalies.items():
-        anomalies_str = ', '.join([f'"{a}"' for a in anomalies])
-        anomalies_lines.append(f'            "{obj}": [{anomalies_str}]')
-    anomalies_dict_str = ',\n'.join(anomalies_lines)
-    
-    code = f'''
-    elif dataset == "{dataset_name}":
-        objects = [{objects_str}]
-        
-        object_anomalies = {{
-{anomalies_dict_str}
-        }}
+        w(sep)
+        w(f'            "{obj}": [')
+        w(_quote_join(anomalies))
+        w(']')
+        sep = ',\n'
+    
+    w('''
+        }
         
         # 根据预处理策略配置掩码和旋转
         if preprocess in ["informed_no_mask", "agnostic_no_mask"]:
-            masking_default = {{o: False for o in objects}}
+            masking_default = {o: False for o in objects}
         else:
             # 默认启用掩码,可根据实际情况手动调整
-            masking_default = {{o: True for o in objects}}
+            masking_default = {o: True for o in objects}
         
         if preprocess in ["agnostic", "agnostic_no_mask"]:
-            rotation_default = {{o: True for o in objects}}
+            rotation_default = {o: True for o in objects}
         elif preprocess in ["informed", "masking_only", "informed_no_mask"]:
-            rotation_default = {{o: False for o in objects}}
-'''
+            rotation_default = {o: False for o in objects}
+''')
     
-    return code
+    return buf.getvalue()
 
 
 def register_dataset(data_root: str, dataset_name: str):